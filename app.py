@@ -1,27 +1,189 @@
-from flask import Flask, render_template, request, jsonify
-import json
+from flask import Flask, render_template, request
+import atexit
+import hashlib
+import logging
 import os
+import tempfile
+import threading
+import orjson
 from werkzeug.utils import secure_filename
-import random
+from collections import OrderedDict
+import numpy as np
 from typing import Dict, List, Any
 from src.meal_optimizer import MealOptimizer
 
+try:
+    import fcntl
+except ImportError:  # Windows: only the single-process dev server runs there
+    fcntl = None
+
 app = Flask(__name__)
+logger = logging.getLogger(__name__)
 app.config['UPLOAD_FOLDER'] = 'uploads'
+app.config['KEEP_UPLOADS'] = False  # Save validated uploads to UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
-# Ensure upload directory exists
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+def ojson(payload, status=200):
+    """Serialize payload with orjson into a JSON response"""
+    return app.response_class(orjson.dumps(payload), status=status, mimetype='application/json')
+
+# Encoded response bodies from conditional_ojson as request path -> (version, bytes)
+_encoded_bodies = {}
+
+def conditional_ojson(version, build_payload):
+    """
+    Return a JSON response tagged with an ETag for version, or an empty 304 if the
+    client already holds that version. The payload is only built and encoded the
+    first time a version is served; later requests reuse the encoded bytes.
+    """
+    if request.if_none_match.contains_weak(version):
+        response = app.response_class(status=304)
+    else:
+        cached = _encoded_bodies.get(request.path)
+        if cached is None or cached[0] != version:
+            cached = (version, orjson.dumps(build_payload()))
+            _encoded_bodies[request.path] = cached
+        response = app.response_class(cached[1], mimetype='application/json')
+    response.set_etag(version, weak=True)
+    # Clients may keep the body but must revalidate, since ratings can change at any time
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+MEALS_FILE = 'data/meals.json'
+
+# Parsed JSON files keyed by path; each entry is (st_mtime_ns, data)
+_json_cache = {}
+
+def load_json_cached(path):
+    """Return parsed JSON for path, re-reading the file only when its mtime changes"""
+    mtime = os.stat(path).st_mtime_ns
+    cached = _json_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'rb') as f:
+        data = orjson.loads(f.read())
+    # Another process rewrote the file; keep showing this process's unflushed ratings
+    with _write_lock:
+        apply_rating_changes(data, _pending_writes.get(path, {}))
+    _json_cache[path] = (mtime, data)
+    return data
+
+def json_version(path):
+    """
+    Return a token that changes whenever the content of path changes on disk or in the cache.
+    Unflushed edits are identified by a hash of their content rather than a local counter,
+    so worker processes holding different edits never hand out the same token.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        mtime = 0
+    with _write_lock:
+        changes = _pending_writes.get(path)
+        if not changes:
+            return str(mtime)
+        digest = hashlib.blake2b(orjson.dumps(changes, option=orjson.OPT_SORT_KEYS),
+                                 digest_size=8).hexdigest()
+    return f'{mtime}-{digest}'
+
+def save_json_cached(path, data):
+    """Atomically write data to path and refresh its cache entry"""
+    # A unique temp file per write, so concurrent writers never share a half-written file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    _json_cache[path] = (os.stat(path).st_mtime_ns, data)
+
+def apply_rating_changes(meals, changes):
+    """Set user_rating on meals from a title -> rating dict"""
+    if changes:
+        for meal in meals:
+            if meal['title'] in changes:
+                meal['user_rating'] = changes[meal['title']]
+
+# Debounced write-behind: edits land in the cache immediately and are flushed
+# to disk once no further edits have arrived for FLUSH_DELAY_SECONDS.
+# Only the changed ratings are queued (path -> {title: rating}); a flush re-reads
+# the file under a lock and applies them, so edits flushed by other worker
+# processes in the meantime are kept rather than overwritten by a stale copy.
+FLUSH_DELAY_SECONDS = 0.5
+_write_lock = threading.Lock()
+_pending_writes = {}
+_flush_timer = None
+
+def schedule_rating_writes(path, changes):
+    """Queue title -> rating changes for path, collapsing bursts of edits into one write"""
+    global _flush_timer
+    with _write_lock:
+        _pending_writes.setdefault(path, {}).update(changes)
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+        _flush_timer = threading.Timer(FLUSH_DELAY_SECONDS, flush_pending_writes)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+def flush_pending_writes():
+    """Write all queued JSON files to disk"""
+    global _flush_timer
+    with _write_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        pending = list(_pending_writes.items())
+        _pending_writes.clear()
+        for path, changes in pending:
+            try:
+                with open(f'{path}.lock', 'ab') as lock_file:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    with open(path, 'rb') as f:
+                        data = orjson.loads(f.read())
+                    apply_rating_changes(data, changes)
+                    save_json_cached(path, data)
+            except (OSError, orjson.JSONDecodeError):
+                logger.exception("Failed to write %s", path)
+
+atexit.register(flush_pending_writes)
+
+# Shared optimizer as (meals.json st_mtime_ns, optimizer); rebuilt when the meals file changes
+_optimizer_cache = (None, None)
+_optimizer_lock = threading.Lock()
+
+def get_optimizer():
+    """Return the shared MealOptimizer, reloading it if meals.json changed on disk"""
+    global _optimizer_cache
+    mtime = os.stat(MEALS_FILE).st_mtime_ns
+    with _optimizer_lock:
+        cached_mtime, optimizer = _optimizer_cache
+        if optimizer is None or cached_mtime != mtime:
+            optimizer = MealOptimizer()
+            _optimizer_cache = (mtime, optimizer)
+    return optimizer
 
 # Load meal data from JSON file
 def load_meal_data():
     try:
-        with open('data/meals.json', 'r') as f:
-            return json.load(f)
+        return load_json_cached(MEALS_FILE)
     except FileNotFoundError:
         return []
 
-SAMPLE_MEALS = load_meal_data()
+# (meals list, title -> meal) for the meals list currently held in the cache
+_meals_by_title = (None, {})
+
+def find_meal_by_title(meals, title):
+    """Return the meal with the given title, or None, via an index built once per meals list"""
+    global _meals_by_title
+    indexed_meals, index = _meals_by_title
+    if indexed_meals is not meals:
+        # Build from the end so the first meal with a given title wins
+        index = {meal['title']: meal for meal in reversed(meals)}
+        _meals_by_title = (meals, index)
+    return index.get(title)
 
 @app.route('/')
 def index():
@@ -34,25 +196,58 @@ def ratings():
 @app.route('/upload', methods=['POST'])
 def upload_file():
     if 'file' not in request.files:
-        return jsonify({'error': 'No file uploaded'}), 400
+        return ojson({'error': 'No file uploaded'}, 400)
     
     file = request.files['file']
     if file.filename == '':
-        return jsonify({'error': 'No file selected'}), 400
+        return ojson({'error': 'No file selected'}, 400)
     
     if file and file.filename.endswith('.json'):
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
-        
+        # Validate straight from the upload stream; only keep files that parse
+        raw = file.stream.read()
         try:
-            with open(filepath, 'r') as f:
-                meals_data = json.load(f)
-            return jsonify({'message': 'File uploaded successfully', 'meals_count': len(meals_data)})
-        except json.JSONDecodeError:
-            return jsonify({'error': 'Invalid JSON file'}), 400
+            meals_data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return ojson({'error': 'Invalid JSON file'}, 400)
+        
+        # Uploads are only validated and counted, so only keep them when asked to
+        if app.config['KEEP_UPLOADS']:
+            os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+            filename = secure_filename(file.filename)
+            filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+            with open(filepath, 'wb') as f:
+                f.write(raw)
+        
+        return ojson({'message': 'File uploaded successfully', 'meals_count': len(meals_data)})
     
-    return jsonify({'error': 'Please upload a JSON file'}), 400
+    return ojson({'error': 'Please upload a JSON file'}, 400)
+
+# LRU of encoded /generate_meal_plan responses as cache key -> (body, status)
+PLAN_CACHE_SIZE = 256
+_plan_cache = OrderedDict()
+_plan_cache_lock = threading.Lock()
+
+def plan_cache_key(requirements, objective, meal_frequency):
+    """Hash the canonicalized request together with the current meals version"""
+    raw = orjson.dumps((requirements, objective, meal_frequency, json_version(MEALS_FILE)),
+                       option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+def get_cached_plan(cache_key):
+    """Return the cached (body, status) for cache_key, or None"""
+    with _plan_cache_lock:
+        cached = _plan_cache.get(cache_key)
+        if cached is not None:
+            _plan_cache.move_to_end(cache_key)
+        return cached
+
+def cache_plan(cache_key, body, status):
+    """Store an encoded response, evicting the least recently used entry when full"""
+    with _plan_cache_lock:
+        _plan_cache[cache_key] = (body, status)
+        _plan_cache.move_to_end(cache_key)
+        if len(_plan_cache) > PLAN_CACHE_SIZE:
+            _plan_cache.popitem(last=False)
 
 @app.route('/generate_meal_plan', methods=['POST'])
 def generate_meal_plan():
@@ -63,236 +258,220 @@ def generate_meal_plan():
         meal_frequency = data.get('mealFrequency', 2)  # Default to 2 times per week
         
         # Log incoming request for debugging
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"=== Received optimization request ===")
-        logger.info(f"Requirements keys: {list(requirements.keys())}")
-        logger.info(f"Sample values - minCalories: {requirements.get('minCalories')}, minVitaminD: {requirements.get('minVitaminD')}")
-        logger.info(f"Objective: {objective}, Meal frequency: {meal_frequency}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("=== Received optimization request ===")
+            logger.info("Requirements keys: %s", list(requirements.keys()))
+            logger.info("Sample values - minCalories: %s, minVitaminD: %s",
+                        requirements.get('minCalories'), requirements.get('minVitaminD'))
+            logger.info("Objective: %s, Meal frequency: %s", objective, meal_frequency)
         
-        # Initialize the meal optimizer
-        optimizer = MealOptimizer()
+        # The optimizer reads meals.json from disk, so make sure pending rating edits are on it
+        flush_pending_writes()
+        
+        # Identical requests against the same meals data reuse the previous response
+        cache_key = plan_cache_key(requirements, objective, meal_frequency)
+        cached = get_cached_plan(cache_key)
+        if cached is not None:
+            body, status = cached
+            return app.response_class(body, status=status, mimetype='application/json')
+        
+        # Get the shared meal optimizer
+        optimizer = get_optimizer()
         
         # Convert frontend requirements to optimization format
         optimization_result = run_optimization(optimizer, requirements, objective, meal_frequency)
         
         if optimization_result['status'] not in ['OPTIMAL', 'FEASIBLE']:
-            return jsonify({
+            response = ojson({
                 'success': False,
                 'error': f"Optimization failed: {optimization_result.get('message', 'No feasible solution found')}"
-            }), 400
-        
-        # Convert optimization result to meal plan format
-        meal_plan = convert_optimization_to_meal_plan(optimization_result)
+            }, 400)
+        else:
+            # Convert optimization result to meal plan format
+            meal_plan = convert_optimization_to_meal_plan(optimization_result)
+            
+            response = ojson({
+                'success': True,
+                'meal_plan': meal_plan,
+                'optimization_results': {
+                    'status': optimization_result['status'],
+                    'total_cost': optimization_result['total_cost'],
+                    'num_meals': optimization_result['num_meals_selected'],
+                    'nutritional_summary': optimization_result['nutritional_summary']
+                }
+            })
         
-        return jsonify({
-            'success': True,
-            'meal_plan': meal_plan,
-            'optimization_results': {
-                'status': optimization_result['status'],
-                'total_cost': optimization_result['total_cost'],
-                'num_meals': optimization_result['num_meals_selected'],
-                'nutritional_summary': optimization_result['nutritional_summary']
-            }
-        })
+        cache_plan(cache_key, response.get_data(), response.status_code)
+        return response
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
+
+# (profile nutrient, min request key, default min, max request key, default max)
+NUTRIENT_REQUIREMENT_SPEC = (
+    ('calories', 'minCalories', 300, 'maxCalories', 700),
+    ('protein', 'minProtein', 20, 'maxProtein', 35),
+    ('carbs', 'minCarbs', 30, 'maxCarbs', 90),
+    ('fat', 'minFat', 10, 'maxFat', 25),
+    ('vitaminA', 'minVitaminA', 150, 'maxVitaminA', 300),
+    ('vitaminC', 'minVitaminC', 15, 'maxVitaminC', 30),
+    ('vitaminD', 'minVitaminD', 3, 'maxVitaminD', 8),
+    ('vitaminE', 'minVitaminE', 3, 'maxVitaminE', 6),
+    ('calcium', 'minCalcium', 200, 'maxCalcium', 400),
+    ('iron', 'minIron', 2, 'maxIron', 4),
+    ('magnesium', 'minMagnesium', 60, 'maxMagnesium', 120),
+    ('potassium', 'minPotassium', 600, 'maxPotassium', 1000),
+    ('sodium', 'minSodium', 200, 'maxSodium', 400),
+)
 
 def run_optimization(optimizer: MealOptimizer, requirements: Dict, objective: str = "minimize_cost", meal_frequency: int = 2) -> Dict:
     """
     Run optimization with custom nutritional requirements from frontend.
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     # Log received requirements for debugging
-    logger.info(f"Received requirements: {requirements}")
+    logger.info("Received requirements: %s", requirements)
     
     # Create a custom nutritional profile from frontend requirements
     custom_profile = {
-        "calories": {
-            "min": requirements.get('minCalories', 300),
-            "max": requirements.get('maxCalories', 700)
-        },
-        "protein": {
-            "min": requirements.get('minProtein', 20),
-            "max": requirements.get('maxProtein', 35)
-        },
-        "carbs": {
-            "min": requirements.get('minCarbs', 30),
-            "max": requirements.get('maxCarbs', 90)
-        },
-        "fat": {
-            "min": requirements.get('minFat', 10),
-            "max": requirements.get('maxFat', 25)
-        },
-        "vitaminA": {
-            "min": requirements.get('minVitaminA', 150),
-            "max": requirements.get('maxVitaminA', 300)
-        },
-        "vitaminC": {
-            "min": requirements.get('minVitaminC', 15),
-            "max": requirements.get('maxVitaminC', 30)
-        },
-        "vitaminD": {
-            "min": requirements.get('minVitaminD', 3),
-            "max": requirements.get('maxVitaminD', 8)
-        },
-        "vitaminE": {
-            "min": requirements.get('minVitaminE', 3),
-            "max": requirements.get('maxVitaminE', 6)
-        },
-        "calcium": {
-            "min": requirements.get('minCalcium', 200),
-            "max": requirements.get('maxCalcium', 400)
-        },
-        "iron": {
-            "min": requirements.get('minIron', 2),
-            "max": requirements.get('maxIron', 4)
-        },
-        "magnesium": {
-            "min": requirements.get('minMagnesium', 60),
-            "max": requirements.get('maxMagnesium', 120)
-        },
-        "potassium": {
-            "min": requirements.get('minPotassium', 600),
-            "max": requirements.get('maxPotassium', 1000)
-        },
-        "sodium": {
-            "min": requirements.get('minSodium', 200),
-            "max": requirements.get('maxSodium', 400)
-        }
+        nutrient: {'min': requirements.get(min_key, default_min), 'max': requirements.get(max_key, default_max)}
+        for nutrient, min_key, default_min, max_key, default_max in NUTRIENT_REQUIREMENT_SPEC
     }
     
     # Log the custom profile being used
-    logger.info(f"Custom profile created: {custom_profile}")
+    logger.info("Custom profile created: %s", custom_profile)
     
-    # Temporarily add custom profile to optimizer
-    optimizer.nutritional_profiles['custom'] = custom_profile
-    
-    # Run optimization with custom profile
-    result = optimizer.solve(profile_name='custom', max_meals_per_meal=meal_frequency, objective=objective)
-    
-    # Remove custom profile
-    del optimizer.nutritional_profiles['custom']
-    
-    return result
+    # Run optimization with custom profile (passed directly so the shared optimizer is never mutated)
+    return optimizer.solve(profile_name='custom', max_meals_per_meal=meal_frequency,
+                           objective=objective, profile=custom_profile)
+
+DAYS_OF_WEEK = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
 
 def convert_optimization_to_meal_plan(optimization_result: Dict) -> Dict:
     """
     Convert optimization result to the meal plan format expected by frontend.
     """
-    meal_plan = {}
-    
     # Initialize all days
-    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    for day in days:
-        meal_plan[day] = []
+    meal_plan = {day: [] for day in DAYS_OF_WEEK}
     
     # Populate with selected meals
     for meal_info in optimization_result['selected_meals']:
-        day = meal_info['day']
-        meal = meal_info['meal']
-        meal_plan[day].append(meal)
+        meal_plan[meal_info['day']].append(meal_info['meal'])
     
     return meal_plan
 
+# Shared random generator for meal sampling
+_rng = np.random.default_rng()
+
 def generate_weekly_meal_plan(meals: List[Dict], requirements: Dict) -> Dict:
     """
     Simplified meal plan generation for dinners only, one week
     """
-    # Create one week of days
-    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    
     meal_plan = {}
     
-    for day in days:
-        # Filter meals based on nutritional requirements
-        suitable_meals = filter_meals_by_requirements(meals, requirements, {}, 'dinner')
-        
-        if suitable_meals:
+    # Filter meals based on nutritional requirements; nothing has been eaten yet, and that
+    # is the same for every day, so the filter only needs to run once
+    current_nutrition = np.zeros(len(FILTER_NUTRIENTS))
+    suitable_indices = filter_meal_indices(meals, requirements, current_nutrition)
+    
+    for day in DAYS_OF_WEEK:
+        # Sample meal indices and only look up the meal dicts for the picks
+        if len(suitable_indices):
             # Select 1-2 meals for dinner
-            num_meals = min(2, len(suitable_meals))
-            selected_meals = random.sample(suitable_meals, num_meals)
+            num_meals = min(2, len(suitable_indices))
+            selected_indices = _rng.choice(suitable_indices, size=num_meals, replace=False)
         else:
             # Fallback to random selection if no suitable meals found
-            selected_meals = random.sample(meals, min(2, len(meals)))
+            selected_indices = _rng.choice(len(meals), size=min(2, len(meals)), replace=False)
         
-        meal_plan[day] = selected_meals
+        meal_plan[day] = [meals[i] for i in selected_indices]
     
     return meal_plan
 
-def filter_meals_by_requirements(meals: List[Dict], requirements: Dict, current_nutrition: Dict, meal_type: str) -> List[Dict]:
+# Nutrients checked by filter_meals_by_requirements as (current_nutrition key, requirements max key)
+FILTER_NUTRIENTS = (
+    ('calories', 'maxCalories'),
+    ('protein', 'maxProtein'),
+    ('carbs', 'maxCarbs'),
+    ('fat', 'maxFat'),
+    ('sodium_mg', 'maxSodium'),
+)
+
+# (meals list, nutrient matrix) for the meals list most recently filtered
+_filter_matrix = (None, None)
+
+def get_filter_matrix(meals: List[Dict]) -> np.ndarray:
     """
-    Filter meals based on nutritional requirements
+    Return an (N_meals, len(FILTER_NUTRIENTS)) matrix of the nutrients checked when filtering,
+    built once per meals list
     """
-    suitable_meals = []
-    
-    for meal in meals:
-        # Check if adding this meal would exceed maximum limits
-        would_exceed = False
-        
-        # Check calories
-        if current_nutrition['calories'] + meal.get('calories', 0) > requirements.get('maxCalories', 9999):
-            would_exceed = True
-        
-        # Check macros
-        if 'macros' in meal:
-            if current_nutrition['protein'] + meal['macros'].get('protein', 0) > requirements.get('maxProtein', 9999):
-                would_exceed = True
-            if current_nutrition['carbs'] + meal['macros'].get('carbs', 0) > requirements.get('maxCarbs', 9999):
-                would_exceed = True
-            if current_nutrition['fat'] + meal['macros'].get('fat', 0) > requirements.get('maxFat', 9999):
-                would_exceed = True
-        
-        # Check micros
-        if 'micros' in meal:
-            if current_nutrition['sodium_mg'] + meal['micros'].get('sodium_mg', 0) > requirements.get('maxSodium', 9999):
-                would_exceed = True
-        
-        if not would_exceed:
-            suitable_meals.append(meal)
+    global _filter_matrix
+    matrix_meals, matrix = _filter_matrix
+    if matrix_meals is not meals:
+        # Meals without a macros/micros section skip those checks, so store -inf there
+        missing = float('-inf')
+        rows = [
+            [meal.get('calories', 0)]
+            + ([meal['macros'].get(n, 0) for n in ('protein', 'carbs', 'fat')] if 'macros' in meal else [missing] * 3)
+            + [meal['micros'].get('sodium_mg', 0) if 'micros' in meal else missing]
+            for meal in meals
+        ]
+        matrix = np.array(rows, dtype=np.float64).reshape(len(meals), len(FILTER_NUTRIENTS))
+        _filter_matrix = (meals, matrix)
+    return matrix
+
+def filter_meal_indices(meals: List[Dict], requirements: Dict, current_nutrition: np.ndarray) -> np.ndarray:
+    """
+    Return the indices of meals that fit within the nutritional requirements.
+    current_nutrition holds the amounts already consumed, in FILTER_NUTRIENTS order.
+    """
+    matrix = get_filter_matrix(meals)
+    max_vec = np.array([requirements.get(max_key, 9999) for _, max_key in FILTER_NUTRIENTS], dtype=np.float64)
     
-    return suitable_meals
+    # Keep meals that would not push any nutrient over its maximum. Comparing against the
+    # remaining headroom per nutrient avoids materializing an (N_meals, N_nutrients) sum.
+    headroom = max_vec - current_nutrition
+    mask = (matrix <= headroom).all(axis=1)
+    return np.flatnonzero(mask)
+
+def filter_meals_by_requirements(meals: List[Dict], requirements: Dict, current_nutrition: np.ndarray, meal_type: str) -> List[Dict]:
+    """
+    Filter meals based on nutritional requirements
+    """
+    return [meals[i] for i in filter_meal_indices(meals, requirements, current_nutrition)]
 
 @app.route('/get_sample_meals')
 def get_sample_meals():
-    return jsonify(SAMPLE_MEALS)
+    return conditional_ojson(json_version(MEALS_FILE), load_meal_data)
 
 @app.route('/get_all_meals')
 def get_all_meals():
     """Load and return all meals from meals.json"""
     try:
-        meals = load_meal_data()
-        return jsonify({
+        return conditional_ojson(json_version(MEALS_FILE), lambda: {
             'success': True,
-            'meals': meals
+            'meals': load_meal_data()
         })
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 @app.route('/get_sample_meal_plan')
 def get_sample_meal_plan():
     """Load and return the sample weekly plan for visualization"""
     try:
-        with open('sample_weekly_plan.json', 'r') as f:
-            sample_plan = json.load(f)
-        return jsonify({
+        return conditional_ojson(json_version('sample_weekly_plan.json'), lambda: {
             'success': True,
-            'meal_plan': sample_plan
+            'meal_plan': load_json_cached('sample_weekly_plan.json')
         })
     except FileNotFoundError:
-        return jsonify({'error': 'Sample weekly plan file not found'}), 404
-    except json.JSONDecodeError:
-        return jsonify({'error': 'Invalid JSON in sample weekly plan file'}), 400
+        return ojson({'error': 'Sample weekly plan file not found'}, 404)
+    except orjson.JSONDecodeError:
+        return ojson({'error': 'Invalid JSON in sample weekly plan file'}, 400)
 
 @app.route('/get_nutritional_profiles')
 def get_nutritional_profiles():
     """Load and return nutritional profiles"""
     try:
-        with open('data/nutritional_profiles.json', 'r') as f:
-            profiles = json.load(f)
-        response = jsonify({
+        profiles = load_json_cached('data/nutritional_profiles.json')
+        response = ojson({
             'success': True,
             'profiles': profiles
         })
@@ -302,24 +481,22 @@ def get_nutritional_profiles():
         response.headers['Expires'] = '0'
         return response
     except FileNotFoundError:
-        return jsonify({'error': 'Nutritional profiles file not found'}), 404
-    except json.JSONDecodeError:
-        return jsonify({'error': 'Invalid JSON in nutritional profiles file'}), 400
+        return ojson({'error': 'Nutritional profiles file not found'}, 404)
+    except orjson.JSONDecodeError:
+        return ojson({'error': 'Invalid JSON in nutritional profiles file'}, 400)
 
 @app.route('/get_config')
 def get_config():
     """Load and return application configuration"""
     try:
-        with open('config.json', 'r') as f:
-            config = json.load(f)
-        return jsonify({
+        return conditional_ojson(json_version('config.json'), lambda: {
             'success': True,
-            'config': config
+            'config': load_json_cached('config.json')
         })
     except FileNotFoundError:
-        return jsonify({'error': 'Config file not found'}), 404
-    except json.JSONDecodeError:
-        return jsonify({'error': 'Invalid JSON in config file'}), 400
+        return ojson({'error': 'Config file not found'}, 404)
+    except orjson.JSONDecodeError:
+        return ojson({'error': 'Invalid JSON in config file'}, 400)
 
 @app.route('/update_rating', methods=['POST'])
 def update_rating():
@@ -330,33 +507,28 @@ def update_rating():
         rating = data.get('rating')
         
         if not meal_title or rating is None:
-            return jsonify({'error': 'Missing meal_title or rating'}), 400
+            return ojson({'error': 'Missing meal_title or rating'}, 400)
         
-        if not (1 <= rating <= 10):
-            return jsonify({'error': 'Rating must be between 1 and 10'}), 400
+        # Ratings are whole numbers; bool is an int subclass, so compare the exact type
+        if type(rating) is not int or not 1 <= rating <= 10:
+            return ojson({'error': 'Rating must be a whole number between 1 and 10'}, 400)
         
         # Load meals data
         meals = load_meal_data()
         
         # Find and update the meal
-        meal_found = False
-        for meal in meals:
-            if meal['title'] == meal_title:
-                meal['user_rating'] = rating
-                meal_found = True
-                break
-        
-        if not meal_found:
-            return jsonify({'error': 'Meal not found'}), 404
+        meal = find_meal_by_title(meals, meal_title)
+        if meal is None:
+            return ojson({'error': 'Meal not found'}, 404)
+        meal['user_rating'] = rating
         
         # Save updated meals back to file
-        with open('data/meals.json', 'w') as f:
-            json.dump(meals, f, indent=2)
+        schedule_rating_writes(MEALS_FILE, {meal_title: rating})
         
-        return jsonify({'success': True, 'message': f'Rating updated to {rating}'})
+        return ojson({'success': True, 'message': f'Rating updated to {rating}'})
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 @app.route('/get_meals_with_ratings')
 def get_meals_with_ratings():
@@ -364,17 +536,15 @@ def get_meals_with_ratings():
     try:
         meals = load_meal_data()
         
-        # Add default rating of 5 if not present
-        for meal in meals:
-            if 'user_rating' not in meal:
-                meal['user_rating'] = 5
+        # Add default rating of 5 if not present (without touching the cached meals)
+        meals = [meal if 'user_rating' in meal else {**meal, 'user_rating': 5} for meal in meals]
         
-        return jsonify({
+        return ojson({
             'success': True,
             'meals': meals
         })
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 @app.route('/reset_ratings', methods=['POST'])
 def reset_ratings():
@@ -388,13 +558,12 @@ def reset_ratings():
             meal['user_rating'] = 5
         
         # Save updated meals back to file
-        with open('data/meals.json', 'w') as f:
-            json.dump(meals, f, indent=2)
+        schedule_rating_writes(MEALS_FILE, {meal['title']: 5 for meal in meals})
         
-        return jsonify({'success': True, 'message': 'All ratings reset to 5'})
+        return ojson({'success': True, 'message': 'All ratings reset to 5'})
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5001)
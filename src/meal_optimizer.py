@@ -6,7 +6,7 @@ using PuLP. The optimization minimizes total cost while ensuring
 nutritional constraints are met.
 
 Problem Structure:
-- Decision Variables: Binary matrix X[i,j] where i=meal_index, j=day_meal_slot
+- Decision Variables: Binary matrix X[i,d] where i=meal_index, d=day_index
 - Objective: Minimize total cost across all selected meals
 - Constraints: 
   1. Nutritional bounds (macro and micro nutrients)
@@ -15,8 +15,15 @@ Problem Structure:
 """
 
 import json
+import os
+import threading
+import time
+from functools import lru_cache
 import numpy as np
-from pulp import LpProblem, LpMinimize, LpMaximize, LpVariable, LpStatus, lpSum, value
+import orjson
+from pulp import (LpProblem, LpMinimize, LpMaximize, LpVariable, LpAffineExpression, LpStatus, value,
+                  LpStatusOptimal, LpStatusNotSolved, LpSolutionOptimal, LpSolutionNoSolutionFound,
+                  LpSolver, HiGHS, HiGHS_CMD, PULP_CBC_CMD)
 from typing import Dict, List, Tuple, Optional
 import logging
 
@@ -25,11 +32,69 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _read_file_bytes(path: str, mtime: float) -> bytes:
+    """Read a file's raw bytes; cached per (path, mtime)."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def load_json_file(path: str):
+    """
+    Load a JSON file, reading it from disk only when its modification time changes.
+    Only the raw bytes are cached, so every call returns a fresh object that the
+    caller is free to modify.
+    """
+    return orjson.loads(_read_file_bytes(path, os.path.getmtime(path)))
+
+
+def default_solver(time_limit: Optional[float] = None, mip_gap: float = 0.0) -> LpSolver:
+    """
+    Return the solver used when none is given, preferring solvers that avoid
+    writing the model to a temporary file:
+    1. HiGHS through its Python API (highspy), solved in-process
+    2. the HiGHS executable
+    3. the CBC solver bundled with PuLP
+    The command-line solvers are set up to warm-start from variables' initial
+    values; PuLP's in-process HiGHS interface does not support warm starts.
+    
+    Args:
+        time_limit: Maximum solve time in seconds (None for no limit)
+        mip_gap: Relative optimality gap at which the solver may stop early
+    """
+    # A zero gap keeps each solver's own default tolerance
+    gap_rel = mip_gap or None
+    highs = HiGHS(msg=False, threads=os.cpu_count(), timeLimit=time_limit, gapRel=gap_rel)
+    if highs.available():
+        return highs
+    highs_cmd = HiGHS_CMD(msg=False, threads=os.cpu_count(), warmStart=True,
+                          timeLimit=time_limit, gapRel=gap_rel)
+    if highs_cmd.available():
+        return highs_cmd
+    return PULP_CBC_CMD(msg=False, warmStart=True, keepFiles=False,
+                        timeLimit=time_limit, gapRel=gap_rel)
+
+
 class MealOptimizer:
     """
     Linear optimization solver for meal planning with nutritional constraints.
     """
     
+    # Nutritional profile nutrient names -> meal data nutrient names
+    _PROFILE_NUTRIENT_MAP = {
+        "vitaminA": "vitamin_a_mcg",
+        "vitaminC": "vitamin_c_mg", 
+        "vitaminD": "vitamin_d_mcg",
+        "vitaminE": "vitamin_e_mg",
+        "calcium": "calcium_mg",
+        "iron": "iron_mg",
+        "magnesium": "magnesium_mg",
+        "potassium": "potassium_mg",
+        "sodium": "sodium_mg"
+    }
+    # Meal data nutrient names -> nutritional profile nutrient names
+    _NUTRIENT_PROFILE_MAP = {meal_key: profile_key for profile_key, meal_key in _PROFILE_NUTRIENT_MAP.items()}
+    
     def __init__(self, meals_file: str = "data/meals.json", 
                  profiles_file: str = "data/nutritional_profiles.json",
                  config_file: str = "data/config.json"):
@@ -54,8 +119,6 @@ class MealOptimizer:
         self.num_meals = len(self.meals)
         self.days_of_week = self.config["meal_planning"]["days_of_week"]
         self.num_days = len(self.days_of_week)
-        self.meals_per_day = self.config["meal_planning"]["meals_per_day"]["max"]
-        self.total_meal_slots = self.num_days * self.meals_per_day
         
         # Nutritional categories
         self.macro_nutrients = ["protein", "carbs", "fat"]
@@ -66,14 +129,41 @@ class MealOptimizer:
         ]
         self.all_nutrients = self.macro_nutrients + self.micro_nutrients
         
+        # Selected (meal, day) pairs of the last solved plan, used to warm-start the next
+        # solve; the model structure is the same across profiles, only bounds change
+        self._last_selection = None
+        
+        # Model from the last solve, reused while its structure (objective, frequency
+        # limit and set of nutrient bounds) stays the same
+        self._solve_lock = threading.Lock()
+        self._model_key = None
+        self._problem = None
+        self._x = None
+        self._nutrient_constraints = None
+        
+        # Dense per-meal coefficient arrays, built once so solve() never digs through meal dicts
+        # nutrient_matrix[i, k] is the amount of nutrient_names[k] in meal i
+        self.nutrient_names = ["calories"] + self.all_nutrients
+        self.nutrient_index = {nutrient: k for k, nutrient in enumerate(self.nutrient_names)}
+        # Each row reads the meal's sections directly, in nutrient_names order
+        self.nutrient_matrix = np.array(
+            [[meal["calories"]]
+             + [meal["macros"][nutrient] for nutrient in self.macro_nutrients]
+             + [meal["micros"][nutrient] for nutrient in self.micro_nutrients]
+             for meal in self.meals],
+            dtype=np.float64
+        ).reshape(self.num_meals, len(self.nutrient_names))
+        self.cost_vec = np.array([meal["estimated_cost_usd"] for meal in self.meals], dtype=np.float64)
+        self.rating_vec = np.array([meal.get("user_rating", 5) for meal in self.meals],  # Default to 5 if not set
+                                   dtype=np.float64)
+        
         logger.info(f"Initialized optimizer with {self.num_meals} meals, "
-                   f"{self.num_days} days, {self.total_meal_slots} total meal slots")
+                   f"{self.num_days} days, {self.num_meals * self.num_days} (meal, day) variables")
     
     def _load_meals(self) -> List[Dict]:
         """Load meals data from JSON file."""
         try:
-            with open(self.meals_file, 'r') as f:
-                return json.load(f)
+            return load_json_file(self.meals_file)
         except FileNotFoundError:
             logger.error(f"Meals file {self.meals_file} not found")
             raise
@@ -84,8 +174,7 @@ class MealOptimizer:
     def _load_nutritional_profiles(self) -> Dict:
         """Load nutritional profiles from JSON file."""
         try:
-            with open(self.profiles_file, 'r') as f:
-                return json.load(f)
+            return load_json_file(self.profiles_file)
         except FileNotFoundError:
             logger.error(f"Nutritional profiles file {self.profiles_file} not found")
             raise
@@ -96,8 +185,7 @@ class MealOptimizer:
     def _load_config(self) -> Dict:
         """Load configuration from JSON file."""
         try:
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
+            return load_json_file(self.config_file)
         except FileNotFoundError:
             logger.error(f"Config file {self.config_file} not found")
             raise
@@ -105,26 +193,6 @@ class MealOptimizer:
             logger.error(f"Invalid JSON in {self.config_file}")
             raise
     
-    def _get_nutrient_value(self, meal: Dict, nutrient: str) -> float:
-        """
-        Extract nutrient value from meal data.
-        
-        Args:
-            meal: Meal dictionary
-            nutrient: Nutrient name
-            
-        Returns:
-            Nutrient value as float
-        """
-        if nutrient in ["protein", "carbs", "fat"]:
-            return float(meal["macros"][nutrient])
-        elif nutrient in self.micro_nutrients:
-            return float(meal["micros"][nutrient])
-        elif nutrient == "calories":
-            return float(meal["calories"])
-        else:
-            raise ValueError(f"Unknown nutrient: {nutrient}")
-    
     def _map_profile_nutrient(self, profile_nutrient: str) -> str:
         """
         Map nutritional profile nutrient names to meal data nutrient names.
@@ -135,18 +203,7 @@ class MealOptimizer:
         Returns:
             Corresponding nutrient name in meal data
         """
-        mapping = {
-            "vitaminA": "vitamin_a_mcg",
-            "vitaminC": "vitamin_c_mg", 
-            "vitaminD": "vitamin_d_mcg",
-            "vitaminE": "vitamin_e_mg",
-            "calcium": "calcium_mg",
-            "iron": "iron_mg",
-            "magnesium": "magnesium_mg",
-            "potassium": "potassium_mg",
-            "sodium": "sodium_mg"
-        }
-        return mapping.get(profile_nutrient, profile_nutrient)
+        return self._PROFILE_NUTRIENT_MAP.get(profile_nutrient, profile_nutrient)
     
     def _map_nutrient_to_profile(self, nutrient: str) -> str:
         """
@@ -159,92 +216,51 @@ class MealOptimizer:
         Returns:
             Corresponding nutrient name in profile
         """
-        reverse_mapping = {
-            "vitamin_a_mcg": "vitaminA",
-            "vitamin_c_mg": "vitaminC",
-            "vitamin_d_mcg": "vitaminD",
-            "vitamin_e_mg": "vitaminE",
-            "calcium_mg": "calcium",
-            "iron_mg": "iron",
-            "magnesium_mg": "magnesium",
-            "potassium_mg": "potassium",
-            "sodium_mg": "sodium"
-        }
-        return reverse_mapping.get(nutrient, nutrient)
+        return self._NUTRIENT_PROFILE_MAP.get(nutrient, nutrient)
     
     def solve(self, profile_name: str = "healthy-adult", 
-              max_meals_per_meal: int = 2, objective: str = "minimize_cost") -> Dict:
+              max_meals_per_meal: int = 2, objective: str = "minimize_cost",
+              profile: Optional[Dict] = None, solver: Optional[LpSolver] = None,
+              time_limit: Optional[float] = None, mip_gap: float = 0.0,
+              backend: str = "pulp") -> Dict:
         """
         Solve the meal planning optimization problem.
         
         Args:
             profile_name: Nutritional profile to use for constraints
             max_meals_per_meal: Maximum times each meal can be selected
+            profile: Explicit nutritional bounds to use instead of looking up
+                profile_name (profile_name is then only used as a label)
+            solver: PuLP solver to use; defaults to default_solver()
+            time_limit: Maximum solve time in seconds for the default solver
+            mip_gap: Relative optimality gap for the default solver; with a gap or
+                time limit the best plan found is returned with status "FEASIBLE", and
+                status "TIME_LIMIT" means time ran out before any plan was found
+            backend: "pulp" to model with PuLP, or "scipy" to hand the constraint
+                matrices straight to SciPy's HiGHS interface (solver is then ignored)
             
         Returns:
             Dictionary containing solution results
         """
-        if profile_name not in self.nutritional_profiles:
-            raise ValueError(f"Unknown profile: {profile_name}")
+        if profile is None:
+            if profile_name not in self.nutritional_profiles:
+                raise ValueError(f"Unknown profile: {profile_name}")
+            profile = self.nutritional_profiles[profile_name]
         
-        profile = self.nutritional_profiles[profile_name]
-        
-        # Create problem
-        if objective == "minimize_cost":
-            problem = LpProblem("MealPlanning", LpMinimize)
-        elif objective == "maximize_rating":
-            problem = LpProblem("MealPlanning", LpMaximize)
-        else:
+        if objective not in ("minimize_cost", "maximize_rating"):
             raise ValueError(f"Unknown objective: {objective}")
         
-        # Decision variables: X[i,j] = 1 if meal i is selected for meal slot j
-        # i: meal index (0 to num_meals-1)
-        # j: meal slot index (0 to total_meal_slots-1)
-        x = {}
-        for i in range(self.num_meals):
-            for j in range(self.total_meal_slots):
-                x[i, j] = LpVariable(f'x_{i}_{j}', cat='Binary')
-        
-        logger.info(f"Created {self.num_meals * self.total_meal_slots} decision variables")
-        
-        # Objective: Minimize cost or maximize rating
-        objective_expr = []
-        for i in range(self.num_meals):
-            for j in range(self.total_meal_slots):
-                if objective == "minimize_cost":
-                    # Minimize total cost
-                    objective_expr.append(self.meals[i]["estimated_cost_usd"] * x[i, j])
-                elif objective == "maximize_rating":
-                    # Maximize total user rating
-                    user_rating = self.meals[i].get("user_rating", 5)  # Default to 5 if not set
-                    objective_expr.append(user_rating * x[i, j])
-        
-        problem += lpSum(objective_expr)
-        
-        # Constraint 1: Each meal can be selected at most max_meals_per_meal times
-        for i in range(self.num_meals):
-            problem += lpSum([x[i, j] for j in range(self.total_meal_slots)]) <= max_meals_per_meal
-        
-        # Constraint 2: Ensure we have exactly one meal per day
-        for day_idx in range(self.num_days):
-            # Exactly 1 meal per day
-            day_vars = []
-            for i in range(self.num_meals):
-                for meal_slot in range(self.meals_per_day):
-                    j = day_idx * self.meals_per_day + meal_slot
-                    day_vars.append(x[i, j])
-            problem += lpSum(day_vars) == 1
+        if backend not in ("pulp", "scipy"):
+            raise ValueError(f"Unknown backend: {backend}")
         
         # Constraint 3: Nutritional constraints on AVERAGE values
         # For each nutrient, ensure average across all selected meals falls within bounds
         # Since we have exactly 7 meals (1 per day), we can use fixed total
         total_meals = 7  # Fixed number of meals per week
         
-        # Process all nutrients including calories
-        nutrients_to_process = ["calories"] + self.all_nutrients
-        
-        # Add nutritional constraints
-        for nutrient in nutrients_to_process:
+        # Collect the right-hand side of every nutrient bound, keyed by (nutrient, "min"/"max")
+        bounds = {}
+        for nutrient in self.nutrient_names:
             profile_nutrient = self._map_nutrient_to_profile(nutrient)
 
             logger.debug(f"Processing nutrient: {nutrient} -> mapped to profile key: {profile_nutrient}")
@@ -261,12 +277,7 @@ class MealOptimizer:
 
                 # Lower bound constraint
                 if min_val > 0:
-                    nutrient_expr = []
-                    for i in range(self.num_meals):
-                        nutrient_value = self._get_nutrient_value(self.meals[i], nutrient)
-                        for j in range(self.total_meal_slots):
-                            nutrient_expr.append(nutrient_value * x[i, j])
-                    problem += lpSum(nutrient_expr) >= min_val * total_meals
+                    bounds[nutrient, "min"] = min_val * total_meals
                     logger.info(
                         f"  Lower bound constraint: sum >= {min_val * total_meals} "
                         f"(avg >= {min_val})"
@@ -276,12 +287,7 @@ class MealOptimizer:
 
                 # Upper bound constraint
                 if max_val < float("inf"):
-                    nutrient_expr = []
-                    for i in range(self.num_meals):
-                        nutrient_value = self._get_nutrient_value(self.meals[i], nutrient)
-                        for j in range(self.total_meal_slots):
-                            nutrient_expr.append(nutrient_value * x[i, j])
-                    problem += lpSum(nutrient_expr) <= max_val * total_meals
+                    bounds[nutrient, "max"] = max_val * total_meals
                     logger.info(
                         f"  Upper bound constraint: sum <= {max_val * total_meals} "
                         f"(avg <= {max_val})"
@@ -296,42 +302,291 @@ class MealOptimizer:
                 )
                 continue
         
-        # Constraint 4: Limit total number of meals to exactly 7 (1 per day)
-        # This is already enforced by Constraint 2, but we'll keep it for clarity
-        total_meals_expr = [x[i, j] for i in range(self.num_meals) for j in range(self.total_meal_slots)]
-        problem += lpSum(total_meals_expr) == 7
-        
-        # Constraint 5: Non-negativity (already handled by IntVar bounds)
-        
-        logger.info("Added all constraints, solving...")
+        if self.num_meals == 0:
+            logger.error("No solution found. Status: Infeasible (no meals to choose from)")
+            return {
+                "status": "INFEASIBLE",
+                "message": "No feasible solution found. Status: Infeasible. Try relaxing constraints.",
+                "objective_value": None
+            }
         
-        # Solve
-        problem.solve()
-        status = LpStatus[problem.status]
+        # Presolve: drop meals that cannot be part of any feasible plan, i.e. whose amount
+        # of a nutrient breaks a weekly bound even with the most favourable meal on every
+        # other day (small tolerance so borderline meals are left to the solver)
+        candidates = np.ones(self.num_meals, dtype=bool)
+        other_meals = total_meals - 1
+        for (nutrient, bound), rhs in bounds.items():
+            column = self.nutrient_matrix[:, self.nutrient_index[nutrient]]
+            if bound == "max":
+                candidates &= column + other_meals * column.min() <= rhs + 1e-6
+            else:
+                candidates &= column + other_meals * column.max() >= rhs - 1e-6
+        meal_indices = tuple(np.flatnonzero(candidates).tolist())
+        
+        if len(meal_indices) < self.num_meals:
+            dropped = [self.meals[i]["title"] for i in np.flatnonzero(~candidates)]
+            logger.info(f"Presolve dropped {len(dropped)} meals that cannot meet the bounds: {dropped}")
+        if not meal_indices:
+            logger.error("No solution found. Status: Infeasible (no meal can meet the nutritional bounds)")
+            return {
+                "status": "INFEASIBLE",
+                "message": "No feasible solution found. Status: Infeasible. Try relaxing constraints.",
+                "objective_value": None
+            }
         
-        if status == "Optimal":
-            logger.info("Optimal solution found!")
+        if backend == "scipy":
+            return self._solve_scipy(profile_name, max_meals_per_meal, objective, bounds,
+                                     meal_indices, time_limit, mip_gap)
+        
+        # The model is cached between calls and mutated below, so one solve runs at a time
+        with self._solve_lock:
+            # Only rebuild when the model structure changes; a new profile with the same
+            # set of bounds and candidate meals just needs new right-hand sides
+            model_key = (objective, max_meals_per_meal, tuple(bounds), meal_indices)
+            if model_key != self._model_key:
+                self._problem, self._x, self._nutrient_constraints = self._build_problem(
+                    objective, max_meals_per_meal, tuple(bounds), meal_indices
+                )
+                self._model_key = model_key
+            else:
+                logger.info("Reusing model, updating nutrient bounds")
+            problem, x = self._problem, self._x
             
-            # Extract solution
-            solution = self._extract_solution(x, profile_name)
-            solution["status"] = "OPTIMAL"
-            solution["objective_value"] = value(problem.objective)
+            for key, rhs in bounds.items():
+                self._nutrient_constraints[key].changeRHS(rhs)
             
-            return solution
+            if self._last_selection is not None:
+                for key, var in x.items():
+                    var.setInitialValue(1 if key in self._last_selection else 0)
+            
+            logger.info("Added all constraints, solving...")
             
-        elif status == "Not Solved":
-            # Try with a different solver or check if it's actually feasible
-            logger.warning("Solution status: Not Solved, trying alternative approach")
-            # PuLP might need a different solver - try default
-            problem.solve()
-            status = LpStatus[problem.status]
+            # Solve
+            if solver is None:
+                solver = default_solver(time_limit=time_limit, mip_gap=mip_gap)
+            start = time.perf_counter()
+            status_code = problem.solve(solver)
+            # Without a plan, HiGHS reports a time-limit stop as "Not Solved"
+            timed_out = (status_code == LpStatusNotSolved and time_limit is not None
+                         and problem.sol_status == LpSolutionNoSolutionFound
+                         and time.perf_counter() - start >= time_limit)
             
-            if status == "Optimal":
+            if status_code == LpStatusNotSolved and not timed_out and not isinstance(solver, PULP_CBC_CMD):
+                # The solver stopped without an answer (e.g. it failed to run); re-solving
+                # with the same solver would only repeat that, so retry with PuLP's bundled CBC.
+                # Not after a timeout: the retry would spend the whole time limit again
+                logger.warning("Solution status: Not Solved, retrying with CBC")
+                status_code = problem.solve(PULP_CBC_CMD(msg=False, keepFiles=False, warmStart=True,
+                                                         timeLimit=time_limit, gapRel=mip_gap or None))
+            
+            status = LpStatus[status_code]
+            if status_code == LpStatusOptimal:
+                # Solvers report "Optimal" when stopped by a time limit with a plan in hand;
+                # the solution status tells whether that plan is proven optimal
+                proven = problem.sol_status == LpSolutionOptimal and not mip_gap
+                if proven:
+                    logger.info("Optimal solution found!")
+                else:
+                    logger.info("Feasible solution found within the time limit / optimality gap")
+                
+                # Extract solution
                 solution = self._extract_solution(x, profile_name)
-                solution["status"] = "FEASIBLE"
+                solution["status"] = "OPTIMAL" if proven else "FEASIBLE"
                 solution["objective_value"] = value(problem.objective)
+                
                 return solution
         
+        if timed_out:
+            return self._time_limit_result(time_limit)
+        
+        logger.error(f"No solution found. Status: {status}")
+        return {
+            "status": "INFEASIBLE",
+            "message": f"No feasible solution found. Status: {status}. Try relaxing constraints.",
+            "objective_value": None
+        }
+    
+    def _time_limit_result(self, time_limit: float) -> Dict:
+        """Result for a solve that hit its time limit before finding any plan."""
+        logger.error(f"No solution found within the {time_limit}s time limit")
+        return {
+            "status": "TIME_LIMIT",
+            "message": f"Time limit of {time_limit}s reached before a meal plan was found. "
+                       "Try allowing more time.",
+            "objective_value": None
+        }
+    
+    def _build_problem(self, objective: str, max_meals_per_meal: int,
+                       bound_keys: Tuple[Tuple[str, str], ...],
+                       meal_indices: Tuple[int, ...]) -> Tuple[LpProblem, Dict, Dict]:
+        """
+        Build the optimization model for an objective and meal frequency limit.
+        
+        Nutrient bound constraints are created with a zero right-hand side;
+        solve() sets the actual bounds with changeRHS, so the same model can be
+        re-solved for another profile without being rebuilt.
+        
+        Args:
+            objective: "minimize_cost" or "maximize_rating"
+            max_meals_per_meal: Maximum times each meal can be selected
+            bound_keys: (nutrient, "min" or "max") pairs that get a bound constraint
+            meal_indices: Meals that get decision variables (those kept by presolve)
+            
+        Returns:
+            Tuple of (problem, decision variables, nutrient constraints keyed by bound_keys)
+        """
+        # Create problem
+        if objective == "minimize_cost":
+            problem = LpProblem("MealPlanning", LpMinimize)
+        else:
+            problem = LpProblem("MealPlanning", LpMaximize)
+        
+        # Decision variables: X[i,d] = 1 if meal i is selected for day d
+        # i: meal index (0 to num_meals-1), only for meals in meal_indices
+        # d: day index (0 to num_days-1)
+        # With exactly one meal per day, the meal slots within a day are interchangeable,
+        # so per-slot variables would only add symmetric copies of every solution.
+        # The variables must stay binary: the day/frequency rows alone form an assignment
+        # structure, but the nutrient rows break total unimodularity, so the LP relaxation
+        # can have fractional optima (e.g. keto relaxes to 38.35 vs. an integer optimum of 40).
+        x = LpVariable.dicts('x', [(i, d) for i in meal_indices for d in range(self.num_days)],
+                             cat='Binary')
+        
+        logger.info(f"Created {len(x)} decision variables")
+        
+        # Objective: Minimize total cost or maximize total user rating
+        # (.tolist() gives plain floats; numpy scalars don't multiply cleanly with PuLP variables)
+        coef = (self.cost_vec if objective == "minimize_cost" else self.rating_vec).tolist()
+        # Expressions are built directly from (variable, coefficient) pairs, which is much
+        # cheaper than lpSum over coefficient * variable products
+        problem += LpAffineExpression([
+            (x[i, d], coef[i]) for i in meal_indices for d in range(self.num_days)
+        ])
+        
+        # Y[i] = number of days meal i is selected, so the nutrient rows below need one
+        # term per meal instead of one per (meal, day)
+        # Constraint 1: Each meal can be selected at most max_meals_per_meal times, as the
+        # upper bound of Y[i] (a meal can appear at most once per day, so cap at num_days)
+        y = LpVariable.dicts('y', list(meal_indices), lowBound=0,
+                             upBound=min(max_meals_per_meal, self.num_days))
+        for i in meal_indices:
+            problem += LpAffineExpression(
+                [(x[i, d], 1) for d in range(self.num_days)] + [(y[i], -1)]
+            ) == 0
+        
+        # Constraint 2: Ensure we have exactly one meal per day
+        for d in range(self.num_days):
+            problem += LpAffineExpression([(x[i, d], 1) for i in meal_indices]) == 1
+        
+        # Constraint 3: Nutritional bounds, right-hand sides filled in by solve()
+        nutrient_constraints = {}
+        for nutrient in self.nutrient_names:
+            has_min = (nutrient, "min") in bound_keys
+            has_max = (nutrient, "max") in bound_keys
+            if not (has_min or has_max):
+                continue
+            
+            # Total of this nutrient over the week, shared by both bound constraints
+            nutrient_values = self.nutrient_matrix[:, self.nutrient_index[nutrient]].tolist()
+            nutrient_expr = LpAffineExpression([(y[i], nutrient_values[i]) for i in meal_indices])
+            if has_min:
+                nutrient_constraints[nutrient, "min"] = nutrient_expr >= 0
+                problem += nutrient_constraints[nutrient, "min"]
+            if has_max:
+                nutrient_constraints[nutrient, "max"] = nutrient_expr <= 0
+                problem += nutrient_constraints[nutrient, "max"]
+        
+        # No separate "total meals == 7" row: the one-meal-per-day constraints already imply it
+        
+        # Constraint 5: Non-negativity (already handled by IntVar bounds)
+        
+        return problem, x, nutrient_constraints
+    
+    def _solve_scipy(self, profile_name: str, max_meals_per_meal: int, objective: str,
+                     bounds: Dict[Tuple[str, str], float], meal_indices: Tuple[int, ...],
+                     time_limit: Optional[float], mip_gap: float) -> Dict:
+        """
+        Solve the model with scipy.optimize.linprog, skipping PuLP's model objects.
+        
+        Builds the same formulation as _build_problem directly as matrices. Variable
+        p * num_days + d stands for x[meal_indices[p], d].
+        
+        Args:
+            profile_name: Profile label for the solution
+            max_meals_per_meal: Maximum times each meal can be selected
+            objective: "minimize_cost" or "maximize_rating"
+            bounds: Right-hand side of each nutrient bound, keyed by (nutrient, "min"/"max")
+            meal_indices: Meals kept by presolve
+            time_limit: Maximum solve time in seconds (None for no limit)
+            mip_gap: Relative optimality gap at which the solver may stop early
+            
+        Returns:
+            Dictionary containing solution results
+        """
+        # Imported here so the PuLP path doesn't pay for loading SciPy
+        from scipy import sparse
+        from scipy.optimize import linprog
+        
+        meals = np.array(meal_indices)
+        num_candidates = len(meals)
+        num_vars = num_candidates * self.num_days
+        
+        # Objective (linprog always minimizes, so ratings are negated)
+        if objective == "minimize_cost":
+            c = np.repeat(self.cost_vec[meals], self.num_days)
+        else:
+            c = -np.repeat(self.rating_vec[meals], self.num_days)
+        
+        # Exactly one meal per day
+        A_eq = sparse.kron(np.ones((1, num_candidates)), sparse.identity(self.num_days), format="csr")
+        b_eq = np.ones(self.num_days)
+        
+        # Per-meal frequency limit, skipped when it cannot bind
+        A_blocks, b_blocks = [], []
+        if max_meals_per_meal < self.num_days:
+            A_blocks.append(sparse.kron(sparse.identity(num_candidates), np.ones((1, self.num_days))))
+            b_blocks.append(np.full(num_candidates, float(max_meals_per_meal)))
+        
+        # Nutrient bounds, lower bounds negated into <= rows
+        if bounds:
+            rows, rhs = [], []
+            for (nutrient, bound), value_rhs in bounds.items():
+                row = np.repeat(self.nutrient_matrix[meals, self.nutrient_index[nutrient]], self.num_days)
+                sign = 1.0 if bound == "max" else -1.0
+                rows.append(sign * row)
+                rhs.append(sign * value_rhs)
+            A_blocks.append(sparse.csr_matrix(np.array(rows)))
+            b_blocks.append(np.array(rhs))
+        
+        A_ub = sparse.vstack(A_blocks, format="csr") if A_blocks else None
+        b_ub = np.concatenate(b_blocks) if b_blocks else None
+        
+        options = {"disp": False}
+        if time_limit is not None:
+            options["time_limit"] = time_limit
+        if mip_gap:
+            options["mip_rel_gap"] = mip_gap
+        
+        logger.info(f"Solving with SciPy: {num_vars} variables")
+        result = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=(0, 1),
+                         method="highs", integrality=np.ones(num_vars), options=options)
+        
+        # status 0: optimal; 1: stopped at an iteration/time limit, possibly with a plan
+        if result.x is not None and result.status in (0, 1):
+            proven = result.status == 0 and not mip_gap
+            plan = result.x.reshape(num_candidates, self.num_days) > 0.5
+            selected = [(int(meals[p]), int(d)) for p, d in zip(*np.nonzero(plan))]
+            
+            solution = self._build_solution(selected, profile_name)
+            solution["status"] = "OPTIMAL" if proven else "FEASIBLE"
+            solution["objective_value"] = float(result.fun if objective == "minimize_cost" else -result.fun)
+            return solution
+        
+        if result.status == 1 and time_limit is not None:
+            return self._time_limit_result(time_limit)
+        
+        # Report infeasibility with the same wording as the PuLP path
+        status = "Infeasible" if result.status == 2 else result.message
         logger.error(f"No solution found. Status: {status}")
         return {
             "status": "INFEASIBLE",
@@ -347,36 +602,55 @@ class MealOptimizer:
             x: Decision variables dictionary
             profile_name: Profile used for solving
             
+        Returns:
+            Solution dictionary
+        """
+        selected = []
+        for key, var in x.items():
+            var_value = var.varValue
+            if var_value is not None and var_value > 0.5:  # Binary variable
+                selected.append(key)
+        
+        return self._build_solution(selected, profile_name)
+    
+    def _build_solution(self, selected: List[Tuple[int, int]], profile_name: str) -> Dict:
+        """
+        Build the solution dictionary from the selected (meal, day) pairs.
+        
+        Args:
+            selected: (meal index, day index) pairs in the plan
+            profile_name: Profile used for solving
+            
         Returns:
             Solution dictionary
         """
         selected_meals = []
+        selected_meal_indices = []
         meal_schedule = {}
         
         # Initialize meal schedule
         for day in self.days_of_week:
             meal_schedule[day] = []
         
-        # Extract selected meals
-        for i in range(self.num_meals):
-            for j in range(self.total_meal_slots):
-                if x[i, j].varValue is not None and x[i, j].varValue > 0.5:  # Binary variable
-                    day_idx = j // self.meals_per_day
-                    meal_idx = j % self.meals_per_day
-                    day = self.days_of_week[day_idx]
-                    
-                    meal_info = {
-                        "meal": self.meals[i],
-                        "day": day,
-                        "meal_slot": meal_idx + 1,
-                        "cost": self.meals[i]["estimated_cost_usd"]
-                    }
-                    
-                    selected_meals.append(meal_info)
-                    meal_schedule[day].append(meal_info)
+        for i, d in selected:
+            day = self.days_of_week[d]
+            
+            meal_info = {
+                "meal": self.meals[i],
+                "day": day,
+                "meal_slot": 1,  # One meal per day
+                "cost": self.meals[i]["estimated_cost_usd"]
+            }
+            
+            selected_meals.append(meal_info)
+            selected_meal_indices.append(i)
+            meal_schedule[day].append(meal_info)
+        
+        # Remember this plan as the starting point for the next solve
+        self._last_selection = frozenset(selected)
         
         # Calculate nutritional summary
-        nutritional_summary = self._calculate_nutritional_summary(selected_meals)
+        nutritional_summary = self._calculate_nutritional_summary(selected_meal_indices)
         
         return {
             "profile_used": profile_name,
@@ -387,29 +661,28 @@ class MealOptimizer:
             "num_meals_selected": len(selected_meals)
         }
     
-    def _calculate_nutritional_summary(self, selected_meals: List[Dict]) -> Dict:
+    def _calculate_nutritional_summary(self, selected_meal_indices: List[int]) -> Dict:
         """
         Calculate nutritional summary for selected meals.
         
         Args:
-            selected_meals: List of selected meal dictionaries
+            selected_meal_indices: Indices of the selected meals (one entry per selection)
             
         Returns:
             Nutritional summary dictionary
         """
-        if not selected_meals:
+        if not selected_meal_indices:
             return {}
         
-        summary = {}
-        num_meals = len(selected_meals)
+        # Sum every nutrient column of the selected rows at once
+        totals = self.nutrient_matrix[selected_meal_indices].sum(axis=0)
+        averages = totals / len(selected_meal_indices)
         
-        for nutrient in ["calories"] + self.all_nutrients:
-            total = sum(self._get_nutrient_value(meal["meal"], nutrient) 
-                       for meal in selected_meals)
-            average = total / num_meals
+        summary = {}
+        for nutrient, k in self.nutrient_index.items():
             summary[nutrient] = {
-                "total": total,
-                "average": average
+                "total": totals[k].item(),
+                "average": averages[k].item()
             }
         
         return summary
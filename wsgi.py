@@ -0,0 +1,15 @@
+"""
+WSGI entry point for serving Meal Lab with a production server, e.g.:
+
+    gunicorn -w 4 -k gthread --threads 4 -b 0.0.0.0:5001 wsgi:app
+
+Each worker process keeps its own in-memory copy of the JSON data. Rating
+edits are queued per meal and flushed shortly afterwards under a file lock
+that re-reads the file first, so workers don't overwrite each other's
+ratings; other workers see an edit once it has been flushed.
+"""
+
+from app import app
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5001)